@@ -6,10 +6,13 @@ Autor: Italo Herodoto - Estudante de Engenharia Naval (UFPE)
 
 import sys
 import subprocess
-import importlib
+import importlib.util
+import math
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Union, List, Optional
 import csv
 from datetime import datetime
@@ -17,28 +20,27 @@ import os
 
 # --- INSTALAÇÃO AUTOMÁTICA DE DEPENDÊNCIAS ---
 def install_package(package_name):
-    """Instala pacote automaticamente se não estiver disponível"""
+    """Instala pacote automaticamente se não estiver disponível
+
+    Usa find_spec, que só localiza o módulo no disco, em vez de
+    import_module, que o executaria por completo só para testar.
+    """
+    if importlib.util.find_spec(package_name.split('.')[0]) is not None:
+        return True
+    print(f"Instalando {package_name}...")
     try:
-        importlib.import_module(package_name.split('.')[0])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
         return True
-    except ImportError:
-        print(f"Instalando {package_name}...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
-            return True
-        except:
-            print(f"Falha ao instalar {package_name}")
-            return False
+    except:
+        print(f"Falha ao instalar {package_name}")
+        return False
 
-# Lista de dependências necessárias
+# Lista de dependências necessárias (verificada apenas na execução como
+# script, não a cada import do módulo)
 REQUIRED_PACKAGES = ['numpy', 'pandas', 'matplotlib']
 
-# Instala automaticamente o que faltar
-for package in REQUIRED_PACKAGES:
-    install_package(package)
-
-import matplotlib.pyplot as plt
-plt.style.use('default')
+# matplotlib é importado sob demanda dentro de plot_results: o caminho
+# comum (cálculo + CSV, sem gráficos) não paga o custo de importação
 
 # --- CONFIGURAÇÃO GLOBAL ---
 class Config:
@@ -48,11 +50,212 @@ class Config:
     GRAVITY = 9.81  # m/s²
     LANGUAGE = 'english'
 
+# Constantes físicas pré-ligadas como floats de módulo: evita o par
+# LOAD_GLOBAL + LOAD_ATTR de Config.X em cada uso e entrega escalares
+# prontos aos kernels
+_RHO = float(Config.WATER_DENSITY)
+_G = float(Config.GRAVITY)
+_NU = float(Config.KINEMATIC_VISCOSITY)
+
+# 1/ln(10): permite trocar log10(x) por log(x) * INV_LN10
+INV_LN10 = 0.4342944819032518
+
+# Conversão exata m/s -> nós (3600/1852), no lugar do 1.944 aproximado
+KNOTS_PER_MPS = 3600.0 / 1852.0
+
+class ResultCols(IntEnum):
+    """Índices das colunas da matriz de resultados (layout Struct-of-Arrays)"""
+    SPEED_MPS = 0
+    SPEED_KTS = 1
+    FROUDE = 2
+    REYNOLDS = 3
+    RT_N = 4
+    RT_KN = 5
+    RF_N = 6
+    RR_N = 7
+    CF = 8
+    P_KW = 9
+
+# Índices como ints puros para uso dentro dos kernels (o Numba não aceita
+# membros de IntEnum como índice de array)
+_SPEED_MPS = int(ResultCols.SPEED_MPS)
+_SPEED_KTS = int(ResultCols.SPEED_KTS)
+_FROUDE = int(ResultCols.FROUDE)
+_REYNOLDS = int(ResultCols.REYNOLDS)
+_RT_N = int(ResultCols.RT_N)
+_RT_KN = int(ResultCols.RT_KN)
+_RF_N = int(ResultCols.RF_N)
+_RR_N = int(ResultCols.RR_N)
+_CF = int(ResultCols.CF)
+_P_KW = int(ResultCols.P_KW)
+
+# Nome de cada coluna (mantém as chaves históricas do dicionário de resultados)
+RESULT_COLUMN_NAMES = {
+    'speed_mps': ResultCols.SPEED_MPS,
+    'speed_knots': ResultCols.SPEED_KTS,
+    'froude': ResultCols.FROUDE,
+    'reynolds': ResultCols.REYNOLDS,
+    'resistance_total_N': ResultCols.RT_N,
+    'resistance_total_kN': ResultCols.RT_KN,
+    'resistance_friction_N': ResultCols.RF_N,
+    'residual_resistance_N': ResultCols.RR_N,
+    'cf_coefficient': ResultCols.CF,
+    'effective_power_kW': ResultCols.P_KW,
+}
+
+class ResistanceResults(Mapping):
+    """Vista tipo dicionário sobre uma única matriz (N, K) contígua
+
+    Em vez de 10 arrays 1-D separados, todos os resultados ficam numa
+    matriz contígua; cada acesso por nome devolve a coluna como view,
+    sem cópia.
+    """
+
+    def __init__(self, data: np.ndarray, columns):
+        self._data = data
+        self._columns = {name: int(RESULT_COLUMN_NAMES[name]) for name in columns}
+
+    def __getitem__(self, key):
+        return self._data[:, self._columns[key]]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Matriz (N, K) subjacente"""
+        return self._data
+
+    def to_frame(self) -> pd.DataFrame:
+        """Converte para DataFrame a partir da matriz homogênea
+
+        Passar a matriz 2-D inteira evita a inferência de dtype coluna a
+        coluna e a consolidação de blocos do construtor via dicionário.
+        """
+        idx = list(self._columns.values())
+        if idx == list(range(self._data.shape[1])):
+            data = self._data
+        else:
+            data = self._data[:, idx]
+        return pd.DataFrame(data, columns=list(self._columns), copy=False)
+
+# --- KERNELS NUMÉRICOS ---
+# Numba é opcional: se instalado, os kernels abaixo são compilados via JIT
+# (laço único, sem temporários, vetorizado pelo LLVM); caso contrário rodam
+# como Python puro, o que é adequado para os ~20-50 pontos típicos.
+# PyArrow é opcional: quando instalado, a exportação CSV escreve direto
+# dos arrays tipados em C++, sem construir um DataFrame intermediário
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    def njit(*args, **kwargs):
+        """Decorador neutro usado quando o Numba não está instalado"""
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+# Assinaturas explícitas: os kernels são compilados uma única vez na
+# importação (~1-2 s por processo), em vez de pagar o warmup do JIT na
+# primeira chamada de cálculo. cache=True não é usado de propósito: o
+# nome deste arquivo contém pontos, então como biblioteca ele é carregado
+# via importlib sob um nome dinâmico, e um cache gravado nessa condição
+# quebra as execuções seguintes como script.
+@njit('void(f8[::1], f8, f8, f8, f8, f8, f8[:, ::1])',
+      fastmath=True)
+def _holtrop_kernel(speeds, S, RR_const, inv_sqrt_gL, L_over_nu, rho, out):
+    """Kernel do método Holtrop: preenche a matriz de resultados num laço único"""
+    n = speeds.shape[0]
+    for i in range(n):
+        v = speeds[i]
+        out[i, _SPEED_MPS] = v
+        out[i, _SPEED_KTS] = v * KNOTS_PER_MPS
+
+        # Velocidade nula: linha de resistência zero, como o limite do
+        # NumPy original (log10(0) -> -inf -> CF = 0; exp(-inf) -> RR = 0),
+        # em vez de erro de domínio em log/divisão
+        if v <= 0.0:
+            out[i, _FROUDE] = 0.0
+            out[i, _REYNOLDS] = 0.0
+            out[i, _CF] = 0.0
+            out[i, _RF_N] = 0.0
+            out[i, _RR_N] = 0.0
+            out[i, _RT_N] = 0.0
+            out[i, _RT_KN] = 0.0
+            out[i, _P_KW] = 0.0
+            continue
+
+        fn = v * inv_sqrt_gL
+        rn = v * L_over_nu
+        cf = 0.075 / (math.log(rn) * INV_LN10 - 2)**2
+        rf = 0.5 * rho * v * v * S * cf
+        rr = RR_const * math.exp(-0.9 / fn)
+        rt = rf + rr
+
+        out[i, _FROUDE] = fn
+        out[i, _REYNOLDS] = rn
+        out[i, _CF] = cf
+        out[i, _RF_N] = rf
+        out[i, _RR_N] = rr
+        out[i, _RT_N] = rt
+        out[i, _RT_KN] = rt * 1e-3
+        out[i, _P_KW] = rt * v * 1e-3
+
+@njit('void(f8[:, ::1], f8[::1], f8, f8[:, :, ::1])',
+      parallel=True, fastmath=True)
+def _holtrop_batch_kernel(hull_consts, speeds, rho, out):
+    """Avalia Holtrop para vários cascos, um por iteração paralela
+
+    hull_consts[h] = (S, RR_const, inv_sqrt_gL, L_over_nu); cada casco é
+    independente, então o laço externo distribui pelos núcleos via prange.
+    """
+    for h in prange(hull_consts.shape[0]):
+        _holtrop_kernel(speeds, hull_consts[h, 0], hull_consts[h, 1],
+                        hull_consts[h, 2], hull_consts[h, 3], rho, out[h])
+
+@njit('void(f8[::1], f8, f8, f8, f8[:, ::1])', fastmath=True)
+def _simple_kernel(speeds, S, inv_sqrt_gL, rho, out):
+    """Kernel do método simplificado: RT = 0.5·ρ·V²·S·(C₁ + C₂·Fn²)"""
+    n = speeds.shape[0]
+    for i in range(n):
+        v = speeds[i]
+        fn = v * inv_sqrt_gL
+        rt = 0.5 * rho * v * v * S * (0.001 + 0.002 * fn * fn)
+        out[i, _SPEED_MPS] = v
+        out[i, _SPEED_KTS] = v * KNOTS_PER_MPS
+        out[i, _FROUDE] = fn
+        out[i, _RT_N] = rt
+        out[i, _RT_KN] = rt * 1e-3
+        out[i, _P_KW] = rt * v * 1e-3
+
 # --- CLASSES PRINCIPAIS ---
-@dataclass
+# slots=True só existe a partir do Python 3.10; em versões anteriores o
+# dataclass mantém o __dict__ normal, preservando o suporte documentado
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class HullParameters:
-    """Parâmetros geométricos do casco com validação"""
-    
+    """Parâmetros geométricos do casco com validação
+
+    Em Python 3.10+, slots=True elimina o __dict__ por instância: o
+    acesso aos atributos (frequente nos caminhos de cálculo) vira um
+    offset fixo em C.
+    """
+
     L: float  # Comprimento na linha d'água [m]
     B: float  # Boca [m]
     T: float  # Calado [m]
@@ -62,11 +265,24 @@ class HullParameters:
     S: Optional[float] = None
     V: Optional[float] = None
     APP: Optional[float] = None
-    
+
+    # Derivados preenchidos em __post_init__ (declarados por causa do slots)
+    _sqrt_gL: float = field(init=False, repr=False, compare=False)
+    _inv_sqrt_gL: float = field(init=False, repr=False, compare=False)
+    _L_over_nu: float = field(init=False, repr=False, compare=False)
+    _c1: float = field(init=False, repr=False, compare=False)
+    _c2: float = field(init=False, repr=False, compare=False)
+    _c3: float = field(init=False, repr=False, compare=False)
+    _c12: float = field(init=False, repr=False, compare=False)
+    _c13: float = field(init=False, repr=False, compare=False)
+    _c12_004: float = field(init=False, repr=False, compare=False)
+    _RR_const: float = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Valida e completa os parâmetros automaticamente"""
         self._validate_parameters()
         self._calculate_missing_parameters()
+        self._precompute_holtrop_constants()
     
     def _validate_parameters(self):
         """Valida os parâmetros básicos com mensagens detalhadas"""
@@ -92,12 +308,15 @@ class HullParameters:
         if self.V is None:
             self.V = self.L * self.B * self.T * self.CB
         
-        # Área molhada (Fórmula de Holtrop para navios mercantes)
+        # Área molhada (Fórmula de Holtrop para navios mercantes), com o
+        # polinômio em forma de Horner e as subexpressões B/T e CB fatoradas
         if self.S is None:
-            self.S = self.L * (2 * self.T + self.B) * np.sqrt(self.CB) * (
-                0.453 + 0.4425 * self.CB - 0.2862 * self.CB**2 - 
-                0.003467 * self.B/self.T + 0.3696 * self.CB * self.B/self.T
-            ) + 2.38 * self.V / self.CB / self.L
+            cb = self.CB
+            bt = self.B / self.T
+            self.S = self.L * (2 * self.T + self.B) * math.sqrt(cb) * (
+                0.453 + cb * (0.4425 - 0.2862 * cb) +
+                bt * (-0.003467 + 0.3696 * cb)
+            ) + 2.38 * self.V / cb / self.L
         
         # Coeficiente de seção mestra (valor típico)
         if self.CM is None:
@@ -111,6 +330,35 @@ class HullParameters:
         if self.APP is None:
             self.APP = 0.5 * np.pi * (0.7 * self.T)**2
 
+    def _precompute_holtrop_constants(self):
+        """Pré-calcula os fatores de Holtrop que dependem só da geometria
+
+        Os coeficientes c1..c13 não dependem da velocidade, então são
+        calculados uma única vez aqui em vez de a cada chamada de
+        calculate_holtrop.
+        """
+        # √(g·L) e seu inverso: usados no número de Froude por todos os
+        # métodos (multiplicar pelo inverso evita a divisão vetorial)
+        self._sqrt_gL = math.sqrt(_G * self.L)
+        self._inv_sqrt_gL = 1.0 / self._sqrt_gL
+
+        # L/ν pré-dividido: o número de Reynolds no kernel vira uma
+        # multiplicação por velocidade (divisão tem ~10x a latência)
+        self._L_over_nu = self.L / _NU
+
+        self._c1 = 2223105 * (self.B/self.L)**1.07961 * (90 - 0.3)**(-1.37565)
+        self._c2 = math.exp(-1.89 * math.sqrt(self._c1))
+        BT = self.B * self.T
+        inv_c3_denom = 1.0 / (self.V * (0.31 * math.sqrt(BT) + self.T))
+        self._c3 = 0.56 * BT**1.5 * inv_c3_denom
+        self._c12 = self.L**3 / self.V
+        self._c13 = 1 + 0.003 * self.LCB
+        self._c12_004 = self._c12**0.004
+
+        # Fator constante da resistência residual: RR = _RR_const * exp(-0.9/Fn)
+        self._RR_const = (self.V * _RHO * _G *
+                          self._c2 * self._c3 * self._c12_004 * self._c13)
+
     def summary(self, language: str = None) -> str:
         """Retorna resumo formatado dos parâmetros"""
         lang = language or Config.LANGUAGE
@@ -151,7 +399,7 @@ class ResistanceCalculator:
         self.hull = hull_params
         self.results = None
     
-    def calculate_holtrop(self, speeds: Union[float, List[float], np.ndarray]) -> dict:
+    def calculate_holtrop(self, speeds: Union[float, List[float], np.ndarray]) -> ResistanceResults:
         """
         Calcula resistência pelo método Holtrop & Mennen (1984)
         
@@ -162,64 +410,42 @@ class ResistanceCalculator:
         4. Resistência Residual: RR = Δ × ρ × g × fatores_correção
         5. Resistência Total: RT = RF + RR
         """
-        speeds = np.asarray(speeds)
-        Fn = speeds / np.sqrt(Config.GRAVITY * self.hull.L)  # Número de Froude
-        
-        # 1. Resistência Friccional (ITTC-1957)
-        Rn = speeds * self.hull.L / Config.KINEMATIC_VISCOSITY
-        CF = 0.075 / (np.log10(Rn) - 2)**2
-        RF = 0.5 * Config.WATER_DENSITY * speeds**2 * self.hull.S * CF
-        
-        # 2. Resistência Residual (Holtrop & Mennen simplificado)
-        c1 = 2223105 * (self.hull.B/self.hull.L)**1.07961 * (90 - 0.3)**(-1.37565)
-        c2 = np.exp(-1.89 * np.sqrt(c1))
-        c3 = 0.56 * (self.hull.B * self.hull.T)**1.5 / (
-            self.hull.V * (0.31 * np.sqrt(self.hull.B * self.hull.T) + self.hull.T))
-        
-        c12 = self.hull.L**3 / self.hull.V
-        c13 = 1 + 0.003 * self.hull.LCB
-        
-        RR = self.hull.V * Config.WATER_DENSITY * Config.GRAVITY * c2 * c3 * c12**0.004 * np.exp(-0.9/Fn) * c13
-        
-        # 3. Resistência Total
-        RTotal = RF + RR
-        
-        self.results = {
-            'speed_mps': speeds,
-            'speed_knots': speeds * 1.944,
-            'froude': Fn,
-            'reynolds': Rn,
-            'resistance_total_N': RTotal,
-            'resistance_total_kN': RTotal / 1000,
-            'resistance_friction_N': RF,
-            'residual_resistance_N': RR,
-            'cf_coefficient': CF,
-            'effective_power_kW': RTotal * speeds / 1000  # Potência efetiva
-        }
-        
+        # float64 contíguo garantido: evita promoções de dtype a cada
+        # operação quando o chamador passa listas de inteiros
+        speeds = np.ascontiguousarray(np.atleast_1d(speeds), dtype=np.float64)
+
+        # Todos os resultados vão numa única matriz (N, K) contígua; o
+        # kernel (JIT se Numba estiver disponível) preenche as grandezas
+        # físicas num laço fundido, fatores c1..c13 pré-calculados em
+        # HullParameters (só geometria)
+        res = np.empty((speeds.shape[0], len(ResultCols)))
+        _holtrop_kernel(
+            speeds, self.hull.S, self.hull._RR_const,
+            self.hull._inv_sqrt_gL, self.hull._L_over_nu,
+            _RHO, res)
+
+        self.results = ResistanceResults(res, RESULT_COLUMN_NAMES)
         return self.results
     
-    def calculate_simple(self, speeds: Union[float, List[float], np.ndarray]) -> dict:
+    def calculate_simple(self, speeds: Union[float, List[float], np.ndarray]) -> ResistanceResults:
         """
         Método simplificado para estimativa rápida
         RT = 0.5 × ρ × V² × S × (C₁ + C₂ × Fn²)
         """
-        speeds = np.asarray(speeds)
-        Fn = speeds / np.sqrt(Config.GRAVITY * self.hull.L)
-        
-        RTotal = 0.5 * Config.WATER_DENSITY * speeds**2 * self.hull.S * (
-            0.001 + 0.002 * Fn**2
-        )
-        
-        self.results = {
-            'speed_mps': speeds,
-            'speed_knots': speeds * 1.944,
-            'froude': Fn,
-            'resistance_total_N': RTotal,
-            'resistance_total_kN': RTotal / 1000,
-            'effective_power_kW': RTotal * speeds / 1000
-        }
-        
+        # float64 contíguo garantido: evita promoções de dtype a cada
+        # operação quando o chamador passa listas de inteiros
+        speeds = np.ascontiguousarray(np.atleast_1d(speeds), dtype=np.float64)
+
+        # zeros (e não empty): o kernel simplificado só preenche 6 das
+        # colunas, e a matriz completa fica acessível via .array
+        res = np.zeros((speeds.shape[0], len(ResultCols)))
+        _simple_kernel(
+            speeds, self.hull.S, self.hull._inv_sqrt_gL,
+            _RHO, res)
+
+        self.results = ResistanceResults(res, (
+            'speed_mps', 'speed_knots', 'froude',
+            'resistance_total_N', 'resistance_total_kN', 'effective_power_kW'))
         return self.results
 
     def export_results(self, filename: str = None) -> str:
@@ -231,15 +457,33 @@ class ResistanceCalculator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"resistance_results_{timestamp}.csv"
         
-        df = pd.DataFrame(self.results)
-        df.to_csv(filename, index=False, float_format='%.4f')
+        if PYARROW_AVAILABLE:
+            # Escrita direta dos arrays para o arquivo, sem DataFrame;
+            # colunas arredondadas a 4 casas como no caminho pandas
+            # (float_format='%.4f'). O cabeçalho é escrito à mão porque o
+            # pyarrow sempre o colocaria entre aspas.
+            names = list(self.results)
+            table = pa.table({name: np.round(self.results[name], 4)
+                              for name in names})
+            with open(filename, 'wb') as f:
+                f.write((','.join(names) + '\n').encode())
+                pacsv.write_csv(
+                    table, f,
+                    write_options=pacsv.WriteOptions(include_header=False,
+                                                     quoting_style='none'))
+        else:
+            df = self.results.to_frame()
+            df.to_csv(filename, index=False, float_format='%.4f')
         return filename
     
     def plot_results(self, save_path: str = None, language: str = None):
         """Gráficos profissionais dos resultados"""
         if self.results is None:
             raise ValueError("Execute o cálculo primeiro")
-        
+
+        import matplotlib.pyplot as plt
+        plt.style.use('default')
+
         lang = language or Config.LANGUAGE
         
         labels = {
@@ -325,24 +569,46 @@ class ResistanceCalculator:
             print(f"\n{' RESULTADOS DA ANÁLISE ':=^80}")
             print(f"{'Veloc (nós)':>10} {'Veloc (m/s)':>10} {'Froude':>8} {'Resist (kN)':>12} {'Potência (kW)':>15}")
             print(f"{'-'*80}")
-            
-            for i in range(min(10, len(self.results['speed_mps']))):
-                print(f"{self.results['speed_knots'][i]:>10.1f} "
-                      f"{self.results['speed_mps'][i]:>10.2f} "
-                      f"{self.results['froude'][i]:>8.3f} "
-                      f"{self.results['resistance_total_kN'][i]:>12.1f} "
-                      f"{self.results.get('effective_power_kW', [0]*len(self.results['speed_mps']))[i]:>15.1f}")
         else:
             print(f"\n{' ANALYSIS RESULTS ':=^80}")
             print(f"{'Speed (kts)':>10} {'Speed (m/s)':>10} {'Froude':>8} {'Resistance (kN)':>12} {'Power (kW)':>15}")
             print(f"{'-'*80}")
-            
-            for i in range(min(10, len(self.results['speed_mps']))):
-                print(f"{self.results['speed_knots'][i]:>10.1f} "
-                      f"{self.results['speed_mps'][i]:>10.2f} "
-                      f"{self.results['froude'][i]:>8.3f} "
-                      f"{self.results['resistance_total_kN'][i]:>12.1f} "
-                      f"{self.results.get('effective_power_kW', [0]*len(self.results['speed_mps']))[i]:>15.1f}")
+
+        # Tabela formatada numa única chamada vetorizada, sem laço Python
+        # linha a linha sobre escalares numpy
+        n = min(10, len(self.results.array))
+        power = self.results.get('effective_power_kW')
+        if power is None:
+            power = np.zeros(n)
+        table = np.column_stack((
+            self.results['speed_knots'][:n],
+            self.results['speed_mps'][:n],
+            self.results['froude'][:n],
+            self.results['resistance_total_kN'][:n],
+            power[:n],
+        ))
+        np.savetxt(sys.stdout, table, fmt='%10.1f %10.2f %8.3f %12.1f %15.1f')
+
+def calculate_holtrop_batch(hulls, speeds) -> list:
+    """Calcula Holtrop para vários cascos de uma vez (varredura paramétrica)
+
+    Útil em laços de otimização de projeto: cada casco é independente e,
+    com Numba instalado, a varredura é distribuída pelos núcleos da CPU.
+    Retorna uma lista de ResistanceResults, na mesma ordem de `hulls`.
+    """
+    speeds = np.ascontiguousarray(np.atleast_1d(speeds), dtype=np.float64)
+
+    hull_consts = np.empty((len(hulls), 4))
+    for j, hull in enumerate(hulls):
+        hull_consts[j, 0] = hull.S
+        hull_consts[j, 1] = hull._RR_const
+        hull_consts[j, 2] = hull._inv_sqrt_gL
+        hull_consts[j, 3] = hull._L_over_nu
+
+    out = np.empty((len(hulls), speeds.shape[0], len(ResultCols)))
+    _holtrop_batch_kernel(hull_consts, speeds, _RHO, out)
+    return [ResistanceResults(out[j], RESULT_COLUMN_NAMES)
+            for j in range(len(hulls))]
 
 # --- FUNÇÕES DE INTERFACE ---
 def clear_screen():
@@ -361,8 +627,8 @@ def get_float_input(prompt: str, default: float) -> float:
 def get_speed_range_recommendation(hull_params: HullParameters, language: str) -> tuple:
     """Recomenda faixa de velocidade baseada no tipo de embarcação"""
     fn_max = 0.45 if hull_params.CB < 0.5 else 0.35  # Froude máximo recomendado
-    v_max_mps = fn_max * np.sqrt(Config.GRAVITY * hull_params.L)
-    v_max_kts = v_max_mps * 1.944
+    v_max_mps = fn_max * hull_params._sqrt_gL
+    v_max_kts = v_max_mps * KNOTS_PER_MPS
     
     v_min_kts = 2.0  # Velocidade mínima prática
     
@@ -432,7 +698,7 @@ def interactive_calculator():
         num_points = int(get_float_input("Number of points (20-50 recommended)", 30))
     
     speeds_knots = np.linspace(min_speed, max_speed, num_points)
-    speeds_mps = speeds_knots / 1.944
+    speeds_mps = speeds_knots / KNOTS_PER_MPS
     
     # Selecionar método
     if Config.LANGUAGE == 'portuguese':
@@ -461,7 +727,8 @@ def interactive_calculator():
     
     # Estatísticas resumidas
     max_resistance = np.max(results['resistance_total_kN'])
-    max_power = np.max(results.get('effective_power_kW', [0]))
+    power = results.get('effective_power_kW')
+    max_power = np.max(power) if power is not None else 0.0
     max_speed = np.max(results['speed_knots'])
     
     if Config.LANGUAGE == 'portuguese':
@@ -506,6 +773,14 @@ def interactive_calculator():
 
 # --- EXECUÇÃO PRINCIPAL ---
 if __name__ == "__main__":
+    # Instalação automática só quando algo realmente falta: no caminho
+    # comum (tudo instalado) nenhum subprocesso pip é disparado
+    try:
+        import numpy, pandas, matplotlib  # noqa: F401
+    except ImportError:
+        for package in REQUIRED_PACKAGES:
+            install_package(package)
+
     try:
         interactive_calculator()
     except KeyboardInterrupt: